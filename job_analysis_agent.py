@@ -4,23 +4,193 @@
 # analyser les données d'emploi et identifier les tendances importantes.
 
 import asyncio
-import requests
-from bs4 import BeautifulSoup
+import re
+import ahocorasick
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import pandas as pd
-import json
-from typing import Dict, List, Any
-from dataclasses import dataclass
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
+import warnings
+from typing import Dict, List, Any, Set, Tuple
+from urllib.parse import urlparse, parse_qsl, urlencode
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 import logging
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Configuration HTTP pour la récupération des pages de résultats
+HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"),
+    "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8"
+}
+MAX_CONCURRENT_REQUESTS = 64
+PAGE_LOAD_TIMEOUT = 10
+SELENIUM_WORKERS = 8
 
-@dataclass
+# Cache HTTP persistant : seules les pages de détail (stables) sont conservées d'une exécution à l'autre
+HTTP_CACHE_PATH = "jobs_cache.sqlite"
+DETAIL_PAGES_EXPIRE_AFTER = timedelta(days=1)
+DETAIL_PAGE_PATTERNS = ('*linkedin.com/jobs/view/*', '*indeed.com/viewjob*', '*indeed.com/rc/clk*')
+
+# Liste des technologies populaires à rechercher
+TECH_KEYWORDS = [
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Go', 'Rust', 'Swift',
+    'TypeScript', 'Kotlin', 'PHP', 'Ruby', 'Scala', 'R', 'SQL'
+]
+
+FRAMEWORK_KEYWORDS = [
+    'React', 'Angular', 'Vue.js', 'Django', 'Flask', 'Spring', 'Express',
+    'Laravel', 'Rails', 'ASP.NET', 'Symfony', 'Bootstrap', 'jQuery'
+]
+
+CERT_KEYWORDS = [
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'CISSP', 'CISM',
+    'PMP', 'Scrum', 'Agile', 'DevOps', 'ITIL', 'CompTIA', 'Cisco'
+]
+
+
+# Catégories de mots-clés, indexées comme dans le dictionnaire d'analyse
+KEYWORD_CATEGORIES = {
+    'technologies': TECH_KEYWORDS,
+    'frameworks': FRAMEWORK_KEYWORDS,
+    'certifications': CERT_KEYWORDS
+}
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Construit un automate Aho-Corasick couvrant tous les mots-clés"""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in KEYWORD_CATEGORIES.items():
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (category, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Appliqués à la description déjà en minuscules, d'où l'absence de re.IGNORECASE
+SALARY_RES = [re.compile(pattern) for pattern in (
+    r'\$[\d,]+\s*-\s*\$[\d,]+',
+    r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
+    r'[\d,]+\s*-\s*[\d,]+\s*€',
+    r'[\d,]+k?\s*-\s*[\d,]+k?\s*€'
+)]
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+
+def _is_word_char(char: str) -> bool:
+    """Indique si un caractère fait partie d'un mot (équivalent de \\w)"""
+    return char.isalnum() or char == '_'
+
+
+def _find_keywords(text: str) -> Dict[str, List[str]]:
+    """Retourne les mots-clés trouvés par catégorie, en un seul parcours de la description en minuscules"""
+    hits = {category: set() for category in KEYWORD_CATEGORIES}
+
+    for end, (category, keyword) in KEYWORD_AUTOMATON.iter(text):
+        start = end - len(keyword) + 1
+        # On ignore les occurrences au milieu d'un mot ("r" dans "rust", "java" dans "javascript")
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        hits[category].add(keyword)
+
+    return {
+        category: [keyword for keyword in keywords if keyword in hits[category]]
+        for category, keywords in KEYWORD_CATEGORIES.items()
+    }
+
+
+def _normalize_url(url: str, keep_params: tuple = ()) -> str:
+    """Normalise l'URL d'une offre pour la déduplication (paramètres de suivi retirés)"""
+    parsed = urlparse(url)
+    params = parse_qsl(parsed.query)
+
+    if keep_params:
+        identity = [(key, value) for key, value in params if key in keep_params]
+        # Sans paramètre identifiant, la requête complète reste la seule clé fiable
+        query = urlencode(identity) if identity else parsed.query
+    else:
+        # Offre identifiée par son chemin : toute la requête sert au suivi
+        query = ""
+
+    return parsed._replace(query=query, fragment="").geturl()
+
+
+def _parse(html: str):
+    """Parse une page HTML avec lxml (bien plus rapide que html.parser)"""
+    return lxml.html.fromstring(html)
+
+
+def _parse_page(html: str):
+    """Parse une page téléchargée ; None si elle est vide ou illisible (corps blanc, etc.)"""
+    if not html or not html.strip():
+        return None
+    try:
+        return _parse(html)
+    except lxml.etree.ParserError:
+        return None
+
+
+def _select_text(element, selector: str) -> str:
+    """Retourne le texte du premier élément correspondant au sélecteur CSS"""
+    matches = element.cssselect(selector)
+    return matches[0].text_content().strip() if matches else ""
+
+
+def _select_attribute(element, selector: str, attribute: str) -> str:
+    """Retourne un attribut du premier élément correspondant au sélecteur CSS"""
+    matches = element.cssselect(selector)
+    return (matches[0].get(attribute) or "").strip() if matches else ""
+
+
+def _chrome_options() -> Options:
+    """Options Chrome communes à tous les drivers Selenium"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # Rendre la main dès DOMContentLoaded : WebDriverWait attend ensuite l'élément utile
+    chrome_options.page_load_strategy = "eager"
+    # Ne pas télécharger les images, inutiles pour lire les descriptions
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return chrome_options
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Crée une session HTTP avec cache, destinée à être partagée par toutes les requêtes"""
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS, limit=1024)
+    cache = SQLiteBackend(
+        cache_name=HTTP_CACHE_PATH,
+        # Les pages de résultats changent en permanence : elles ne sont jamais mises en cache
+        expire_after=0,
+        urls_expire_after={pattern: DETAIL_PAGES_EXPIRE_AFTER for pattern in DETAIL_PAGE_PATTERNS}
+    )
+    return CachedSession(cache=cache, connector=connector, headers=HTTP_HEADERS)
+
+
+@dataclass(slots=True, frozen=True)
 class JobPosting:
     """Structure de données pour une offre d'emploi"""
     title: str
@@ -36,89 +206,220 @@ class JobPosting:
     url: str
 
 
-class JobScraper:
-    """Classe de base pour le scraping d'emplois"""
-
-    def __init__(self):
-        self.chrome_options = Options()
-        self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.driver = None
-
-    def setup_driver(self):
-        """Initialise le driver Selenium"""
+# Schéma Parquet des offres, dans l'ordre des champs de JobPosting
+JOBS_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('company', pa.string()),
+    ('location', pa.string()),
+    ('description', pa.string()),
+    ('technologies', pa.list_(pa.string())),
+    ('frameworks', pa.list_(pa.string())),
+    ('certifications', pa.list_(pa.string())),
+    ('salary_range', pa.string()),
+    ('date_posted', pa.string()),
+    ('recruiter', pa.string()),
+    ('url', pa.string())
+])
+
+
+def _jobs_to_dataframe(jobs: List[JobPosting]) -> pd.DataFrame:
+    """Convertit les offres en DataFrame (colonnes garanties même sans offre)"""
+    return pd.DataFrame([asdict(job) for job in jobs], columns=JOBS_SCHEMA.names)
+
+
+class ChromeDriverPool:
+    """Pool de threads dont chacun possède son propre driver Chrome"""
+
+    def __init__(self, max_workers: int = SELENIUM_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="selenium")
+        # Un driver par thread : un WebDriver ne doit jamais être partagé entre threads
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._startup_lock = threading.Lock()
+        self._unavailable = False
+
+    def _get_driver(self) -> webdriver.Chrome:
+        """Retourne le driver du thread courant, démarré au premier appel"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is not None:
+            return driver
+
+        # Démarrages sérialisés : après un premier échec, aucun autre thread ne relance Chrome
+        with self._startup_lock:
+            if self._unavailable:
+                return None
+            try:
+                driver = webdriver.Chrome(options=_chrome_options())
+            except Exception as e:
+                # Inutile de relancer Chrome pour chaque offre s'il ne démarre pas
+                logger.error(f"Erreur lors de l'initialisation du driver: {e}")
+                self._unavailable = True
+                return None
+
+        self._local.driver = driver
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _discard_driver(self, driver: webdriver.Chrome):
+        """Oublie et ferme le driver du thread courant pour qu'un nouveau soit démarré"""
+        self._local.driver = None
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
         try:
-            self.driver = webdriver.Chrome(options=self.chrome_options)
-            return True
+            driver.quit()
         except Exception as e:
-            logger.error(f"Erreur lors de l'initialisation du driver: {e}")
-            return False
-
-    def close_driver(self):
-        """Ferme le driver Selenium"""
-        if self.driver:
-            self.driver.quit()
-
-
-class LinkedInScraper(JobScraper):
-    """Scraper spécialisé pour LinkedIn"""
-
-    def __init__(self, keywords: List[str]):
-        super().__init__()
-        self.keywords = keywords
-        self.base_url = "https://www.linkedin.com/jobs/search"
-
-    async def scrape_jobs(self, location: str = "", limit: int = 100) -> List[JobPosting]:
-        """Scrape les emplois sur LinkedIn"""
-        jobs = []
-
-        if not self.setup_driver():
-            return jobs
+            logger.error(f"Erreur lors de la fermeture du driver: {e}")
 
+    def _call(self, func, args: tuple):
+        """Appelle func avec le driver du thread courant (exécuté dans le pool)"""
+        driver = self._get_driver()
         try:
-            for keyword in self.keywords:
-                url = f"{self.base_url}?keywords={keyword}&location={location}"
-                self.driver.get(url)
-
-                # Attendre le chargement de la page
-                await asyncio.sleep(5)
+            return func(driver, *args)
+        except (TimeoutException, NoSuchElementException):
+            # Élément attendu absent de la page : la session reste utilisable
+            raise
+        except WebDriverException:
+            # Session perdue (InvalidSessionIdException, Chrome arrêté...) : on repartira d'un driver neuf
+            if driver is not None:
+                self._discard_driver(driver)
+            raise
+
+    async def run(self, func, *args):
+        """Exécute func(driver, *args) dans un thread du pool sans bloquer la boucle d'événements"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self._call, func, args)
+
+    def close(self):
+        """Attend la fin des tâches en cours puis ferme tous les drivers"""
+        self.executor.shutdown(wait=True)
+        with self._drivers_lock:
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.error(f"Erreur lors de la fermeture du driver: {e}")
+            self._drivers.clear()
 
-                # Parser les offres d'emploi
-                jobs_elements = self.driver.find_elements("css selector", ".job-search-card")
 
-                for job_element in jobs_elements[:limit]:
-                    try:
-                        job = self._parse_linkedin_job(job_element)
-                        if job:
-                            jobs.append(job)
-                    except Exception as e:
-                        logger.error(f"Erreur lors du parsing d'un emploi: {e}")
-                        continue
-
-        except Exception as e:
-            logger.error(f"Erreur lors du scraping LinkedIn: {e}")
-        finally:
-            self.close_driver()
+class JobScraper:
+    """Classe de base pour le scraping d'emplois"""
 
-        return jobs
+    # Paramètres de requête qui identifient une offre (les autres ne servent qu'au suivi)
+    url_identity_params = ()
+
+    def __init__(self, driver_pool: ChromeDriverPool = None, session: aiohttp.ClientSession = None,
+                 seen_urls: Set[str] = None):
+        # Un pool fourni de l'extérieur est partagé : le scraper ne le ferme pas
+        self.driver_pool = driver_pool
+        self.session = session
+        # Ensemble partagé des offres déjà collectées pendant l'analyse
+        self.seen_urls = seen_urls if seen_urls is not None else set()
+        # Un scraper = un site : le sémaphore borne la concurrence par hôte
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> str:
+        """Télécharge le HTML d'une page sans passer par le navigateur"""
+        async with self.semaphore:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Erreur lors du téléchargement de {url}: {e}")
+                return ""
+
+    async def _fetch_keyword_cards(self, session: aiohttp.ClientSession, url: str, selector: str,
+                                   limit: int) -> list:
+        """Parcourt les pages de résultats d'une recherche jusqu'à obtenir `limit` cartes"""
+        cards = []
+        start = 0
+
+        # Pagination via "&start=N" : on s'arrête dès que la limite est atteinte
+        while len(cards) < limit:
+            tree = _parse_page(await self._fetch_html(session, f"{url}&start={start}"))
+            page_cards = tree.cssselect(selector) if tree is not None else []
+            if not page_cards:
+                break
+            cards.extend(page_cards)
+            start += len(page_cards)
+
+        return cards[:limit]
+
+    @asynccontextmanager
+    async def _http_session(self):
+        """Fournit la session partagée, ou une session temporaire le temps d'un scraping"""
+        if self.session is not None:
+            yield self.session
+        else:
+            async with _create_session() as session:
+                yield session
+
+    @asynccontextmanager
+    async def _selenium_pool(self):
+        """Fournit le pool de drivers partagé, ou un pool temporaire le temps d'un scraping"""
+        if self.driver_pool is not None:
+            yield self.driver_pool
+        else:
+            pool = ChromeDriverPool(max_workers=1)
+            try:
+                yield pool
+            finally:
+                await asyncio.get_running_loop().run_in_executor(None, pool.close)
+
+    async def _fetch_listing_cards(self, session: aiohttp.ClientSession, urls: List[str], selector: str,
+                                   limit: int) -> list:
+        """Récupère en parallèle les pages de résultats et extrait les cartes d'offres"""
+        results = await asyncio.gather(*[
+            self._fetch_keyword_cards(session, url, selector, limit) for url in urls
+        ])
+
+        return [card for cards in results for card in cards]
+
+    async def _fetch_description(self, session: aiohttp.ClientSession, pool: ChromeDriverPool, url: str,
+                                 selector: str) -> str:
+        """Récupère la description d'une offre, avec repli sur Selenium si elle est rendue en JavaScript"""
+        if not url:
+            return ""
+
+        # URL sans paramètres de suivi : clé de cache stable d'une recherche à l'autre
+        page_url = _normalize_url(url, self.url_identity_params)
+
+        tree = _parse_page(await self._fetch_html(session, page_url))
+        description = _select_text(tree, selector) if tree is not None else ""
+
+        # Selenium n'est démarré que si le HTML statique ne contient pas la description
+        if not description:
+            description = await pool.run(self._render_description, page_url, selector)
+
+        return description
+
+    def _render_description(self, driver: webdriver.Chrome, url: str, selector: str) -> str:
+        """Rend la page avec Selenium et en extrait la description (appel bloquant)"""
+        if driver is None:
+            return ""
+
+        tree = self._load_page(driver, url, selector)
+        return _select_text(tree, selector)
+
+    async def _collect_jobs(self, session: aiohttp.ClientSession, cards: List[Dict[str, str]],
+                            get_details) -> List[JobPosting]:
+        """Récupère en parallèle les détails des offres et construit les JobPosting"""
+        async with self._selenium_pool() as pool:
+            results = await asyncio.gather(*[get_details(session, pool, card['url']) for card in cards],
+                                           return_exceptions=True)
 
-    def _parse_linkedin_job(self, job_element) -> JobPosting:
-        """Parse un élément d'emploi LinkedIn"""
-        try:
-            title = job_element.find_element("css selector", "h3").text
-            company = job_element.find_element("css selector",
-                                               "a[data-tracking-control-name='public_jobs_jserp-result_job-search-card-subtitle']").text
-            location = job_element.find_element("css selector", ".job-search-card__location").text
-            url = job_element.find_element("css selector", "a").get_attribute("href")
-
-            # Extraire plus de détails en cliquant sur l'offre
-            job_details = self._get_job_details(url)
-
-            return JobPosting(
-                title=title,
-                company=company,
-                location=location,
+        jobs = []
+        for card, job_details in zip(cards, results):
+            if isinstance(job_details, Exception):
+                logger.error(f"Erreur lors de la récupération des détails: {job_details}")
+                job_details = {}
+
+            jobs.append(JobPosting(
+                title=card['title'],
+                company=card['company'],
+                location=card['location'],
                 description=job_details.get('description', ''),
                 technologies=job_details.get('technologies', []),
                 frameworks=job_details.get('frameworks', []),
@@ -126,80 +427,67 @@ class LinkedInScraper(JobScraper):
                 salary_range=job_details.get('salary', ''),
                 date_posted=job_details.get('date', ''),
                 recruiter=job_details.get('recruiter', ''),
-                url=url
-            )
-        except Exception as e:
-            logger.error(f"Erreur lors du parsing: {e}")
-            return None
+                url=card['url']
+            ))
 
-    def _get_job_details(self, url: str) -> Dict[str, Any]:
-        """Récupère les détails d'une offre d'emploi"""
-        try:
-            self.driver.get(url)
-            asyncio.sleep(2)
-
-            description_element = self.driver.find_element("css selector", ".show-more-less-html__markup")
-            description = description_element.text if description_element else ""
-
-            # Analyse IA de la description pour extraire technologies, frameworks, etc.
-            analysis = self._analyze_job_description(description)
-
-            return {
-                'description': description,
-                'technologies': analysis.get('technologies', []),
-                'frameworks': analysis.get('frameworks', []),
-                'certifications': analysis.get('certifications', []),
-                'salary': analysis.get('salary', ''),
-                'date': datetime.now().strftime("%Y-%m-%d"),
-                'recruiter': analysis.get('recruiter', '')
-            }
-        except Exception as e:
-            logger.error(f"Erreur lors de la récupération des détails: {e}")
-            return {}
+        return jobs
 
-    def _analyze_job_description(self, description: str) -> Dict[str, List[str]]:
-        """Analyse la description d'emploi avec IA pour extraire les informations"""
-        # Liste des technologies populaires à rechercher
-        tech_keywords = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Go', 'Rust', 'Swift',
-            'TypeScript', 'Kotlin', 'PHP', 'Ruby', 'Scala', 'R', 'SQL'
-        ]
+    def _is_new_url(self, url: str) -> bool:
+        """Indique si l'offre n'a pas encore été collectée, et la marque comme vue"""
+        if not url:
+            return True
 
-        framework_keywords = [
-            'React', 'Angular', 'Vue.js', 'Django', 'Flask', 'Spring', 'Express',
-            'Laravel', 'Rails', 'ASP.NET', 'Symfony', 'Bootstrap', 'jQuery'
-        ]
+        key = _normalize_url(url, self.url_identity_params)
+        if key in self.seen_urls:
+            return False
+        self.seen_urls.add(key)
+        return True
+
+    def _load_page(self, driver: webdriver.Chrome, url: str, selector: str):
+        """Charge une page dans Selenium et attend l'élément attendu avant de la parser"""
+        driver.get(url)
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return _parse(driver.page_source)
 
-        cert_keywords = [
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'CISSP', 'CISM',
-            'PMP', 'Scrum', 'Agile', 'DevOps', 'ITIL', 'CompTIA', 'Cisco'
-        ]
+    def _build_job_details(self, description: str) -> Dict[str, Any]:
+        """Construit le dictionnaire de détails à partir de la description"""
+        # Analyse IA de la description pour extraire technologies, frameworks, etc.
+        analysis = self._analyze_job_description(description)
 
-        found_tech = [tech for tech in tech_keywords if tech.lower() in description.lower()]
-        found_frameworks = [fw for fw in framework_keywords if fw.lower() in description.lower()]
-        found_certs = [cert for cert in cert_keywords if cert.lower() in description.lower()]
+        return {
+            'description': description,
+            'technologies': analysis.get('technologies', []),
+            'frameworks': analysis.get('frameworks', []),
+            'certifications': analysis.get('certifications', []),
+            'salary': analysis.get('salary', ''),
+            'date': datetime.now().strftime("%Y-%m-%d"),
+            'recruiter': analysis.get('recruiter', '')
+        }
+
+    def _analyze_job_description(self, description: str) -> Dict[str, List[str]]:
+        """Analyse la description d'emploi avec IA pour extraire les informations"""
+        # Mise en minuscules une seule fois pour toutes les recherches insensibles à la casse
+        description_lower = description.lower()
+        keywords = _find_keywords(description_lower)
 
         return {
-            'technologies': found_tech,
-            'frameworks': found_frameworks,
-            'certifications': found_certs,
-            'salary': self._extract_salary(description),
+            'technologies': keywords['technologies'],
+            'frameworks': keywords['frameworks'],
+            'certifications': keywords['certifications'],
+            'salary': self._extract_salary(description, description_lower),
             'recruiter': self._extract_recruiter_info(description)
         }
 
-    def _extract_salary(self, description: str) -> str:
+    def _extract_salary(self, description: str, description_lower: str) -> str:
         """Extrait les informations de salaire de la description"""
-        import re
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',
-            r'\$[\d,]+k?\s*-\s*\$[\d,]+k?',
-            r'[\d,]+\s*-\s*[\d,]+\s*€',
-            r'[\d,]+k?\s*-\s*[\d,]+k?\s*€'
-        ]
-
-        for pattern in salary_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in SALARY_RES:
+            match = pattern.search(description_lower)
             if match:
+                # Restitue le texte d'origine, sauf si la mise en minuscules a décalé les positions
+                if len(description) == len(description_lower):
+                    return description[match.start():match.end()]
                 return match.group()
 
         return ""
@@ -207,9 +495,7 @@ class LinkedInScraper(JobScraper):
     def _extract_recruiter_info(self, description: str) -> str:
         """Extrait les informations sur le recruteur"""
         # Logique pour identifier les informations de contact du recruteur
-        import re
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, description)
+        email_match = EMAIL_RE.search(description)
 
         if email_match:
             return email_match.group()
@@ -217,11 +503,76 @@ class LinkedInScraper(JobScraper):
         return ""
 
 
+class LinkedInScraper(JobScraper):
+    """Scraper spécialisé pour LinkedIn"""
+
+    def __init__(self, keywords: List[str], driver_pool: ChromeDriverPool = None,
+                 session: aiohttp.ClientSession = None, seen_urls: Set[str] = None):
+        super().__init__(driver_pool, session, seen_urls)
+        self.keywords = keywords
+        self.base_url = "https://www.linkedin.com/jobs/search"
+
+    async def scrape_jobs(self, location: str = "", limit: int = 100) -> List[JobPosting]:
+        """Scrape les emplois sur LinkedIn"""
+        jobs = []
+
+        urls = [f"{self.base_url}?keywords={keyword}&location={location}" for keyword in self.keywords]
+
+        async with self._http_session() as session:
+            try:
+                jobs_elements = await self._fetch_listing_cards(session, urls, ".job-search-card", limit)
+            except Exception as e:
+                logger.error(f"Erreur lors du scraping LinkedIn: {e}")
+                return jobs
+
+            cards = []
+            for job_element in jobs_elements:
+                try:
+                    card = self._parse_linkedin_card(job_element)
+                except Exception as e:
+                    logger.error(f"Erreur lors du parsing d'un emploi: {e}")
+                    continue
+
+                # Offre déjà collectée via un autre mot-clé ou une autre localisation
+                if self._is_new_url(card['url']):
+                    cards.append(card)
+
+            # Extraire plus de détails en ouvrant les offres, toutes en parallèle
+            jobs = await self._collect_jobs(session, cards, self._get_job_details)
+
+        return jobs
+
+    def _parse_linkedin_card(self, job_element) -> Dict[str, str]:
+        """Parse la carte d'un emploi LinkedIn dans la liste de résultats"""
+        return {
+            'title': _select_text(job_element, "h3"),
+            'company': _select_text(job_element,
+                                    "a[data-tracking-control-name='public_jobs_jserp-result_job-search-card-subtitle']"),
+            'location': _select_text(job_element, ".job-search-card__location"),
+            'url': _select_attribute(job_element, "a", "href")
+        }
+
+    async def _get_job_details(self, session: aiohttp.ClientSession, pool: ChromeDriverPool,
+                               url: str) -> Dict[str, Any]:
+        """Récupère les détails d'une offre d'emploi"""
+        try:
+            description = await self._fetch_description(session, pool, url, ".show-more-less-html__markup")
+
+            return self._build_job_details(description)
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des détails: {e}")
+            return {}
+
+
 class IndeedScraper(JobScraper):
     """Scraper spécialisé pour Indeed"""
 
-    def __init__(self, keywords: List[str]):
-        super().__init__()
+    # "jk" pour les offres classiques, "ad" pour les offres sponsorisées (/pagead/clk)
+    url_identity_params = ('jk', 'ad')
+
+    def __init__(self, keywords: List[str], driver_pool: ChromeDriverPool = None,
+                 session: aiohttp.ClientSession = None, seen_urls: Set[str] = None):
+        super().__init__(driver_pool, session, seen_urls)
         self.keywords = keywords
         self.base_url = "https://www.indeed.com/jobs"
 
@@ -229,76 +580,54 @@ class IndeedScraper(JobScraper):
         """Scrape les emplois sur Indeed"""
         jobs = []
 
-        if not self.setup_driver():
-            return jobs
-
-        try:
-            for keyword in self.keywords:
-                url = f"{self.base_url}?q={keyword}&l={location}"
-                self.driver.get(url)
+        urls = [f"{self.base_url}?q={keyword}&l={location}" for keyword in self.keywords]
 
-                await asyncio.sleep(3)
+        async with self._http_session() as session:
+            try:
+                jobs_elements = await self._fetch_listing_cards(session, urls, ".jobsearch-SerpJobCard", limit)
+            except Exception as e:
+                logger.error(f"Erreur lors du scraping Indeed: {e}")
+                return jobs
 
-                # Parser les offres d'emploi Indeed
-                jobs_elements = self.driver.find_elements("css selector", ".jobsearch-SerpJobCard")
+            cards = []
+            for job_element in jobs_elements:
+                try:
+                    card = self._parse_indeed_card(job_element)
+                except Exception as e:
+                    logger.error(f"Erreur lors du parsing d'un emploi Indeed: {e}")
+                    continue
 
-                for job_element in jobs_elements[:limit]:
-                    try:
-                        job = self._parse_indeed_job(job_element)
-                        if job:
-                            jobs.append(job)
-                    except Exception as e:
-                        logger.error(f"Erreur lors du parsing d'un emploi Indeed: {e}")
-                        continue
+                # Offre déjà collectée via un autre mot-clé ou une autre localisation
+                if self._is_new_url(card['url']):
+                    cards.append(card)
 
-        except Exception as e:
-            logger.error(f"Erreur lors du scraping Indeed: {e}")
-        finally:
-            self.close_driver()
+            # Récupérer les détails des emplois, tous en parallèle
+            jobs = await self._collect_jobs(session, cards, self._get_indeed_job_details)
 
         return jobs
 
-    def _parse_indeed_job(self, job_element) -> JobPosting:
-        """Parse un élément d'emploi Indeed"""
+    def _parse_indeed_card(self, job_element) -> Dict[str, str]:
+        """Parse la carte d'un emploi Indeed dans la liste de résultats"""
         # Implémentation similaire à LinkedIn mais adaptée à la structure Indeed
-        try:
-            title_element = job_element.find_element("css selector", "h2 a span")
-            title = title_element.get_attribute("title") if title_element else ""
-
-            company_element = job_element.find_element("css selector", ".companyName")
-            company = company_element.text if company_element else ""
+        relative_url = _select_attribute(job_element, "h2 a", "href")
 
-            location_element = job_element.find_element("css selector", ".companyLocation")
-            location = location_element.text if location_element else ""
-
-            url_element = job_element.find_element("css selector", "h2 a")
-            relative_url = url_element.get_attribute("href") if url_element else ""
-            url = f"https://www.indeed.com{relative_url}" if relative_url else ""
+        return {
+            'title': _select_attribute(job_element, "h2 a span", "title"),
+            'company': _select_text(job_element, ".companyName"),
+            'location': _select_text(job_element, ".companyLocation"),
+            'url': f"https://www.indeed.com{relative_url}" if relative_url else ""
+        }
 
-            # Récupérer les détails de l'emploi
-            job_details = self._get_indeed_job_details(url)
+    async def _get_indeed_job_details(self, session: aiohttp.ClientSession, pool: ChromeDriverPool,
+                                      url: str) -> Dict[str, Any]:
+        """Récupère les détails d'une offre Indeed"""
+        try:
+            description = await self._fetch_description(session, pool, url, "#jobDescriptionText")
 
-            return JobPosting(
-                title=title,
-                company=company,
-                location=location,
-                description=job_details.get('description', ''),
-                technologies=job_details.get('technologies', []),
-                frameworks=job_details.get('frameworks', []),
-                certifications=job_details.get('certifications', []),
-                salary_range=job_details.get('salary', ''),
-                date_posted=job_details.get('date', ''),
-                recruiter=job_details.get('recruiter', ''),
-                url=url
-            )
+            return self._build_job_details(description)
         except Exception as e:
-            logger.error(f"Erreur lors du parsing Indeed: {e}")
-            return None
-
-    def _get_indeed_job_details(self, url: str) -> Dict[str, Any]:
-        """Récupère les détails d'une offre Indeed"""
-        # Implémentation similaire mais adaptée à Indeed
-        return self._analyze_job_description("")  # Simplification
+            logger.error(f"Erreur lors de la récupération des détails Indeed: {e}")
+            return {}
 
 
 class JobMarketAnalyzer:
@@ -308,45 +637,84 @@ class JobMarketAnalyzer:
         self.jobs_data = []
 
     def analyze_trends(self, jobs: List[JobPosting]) -> Dict[str, Any]:
-        """Analyse les tendances du marché de l'emploi"""
+        """Analyse les tendances du marché de l'emploi (déprécié, utiliser analyze_trends_df)"""
+        warnings.warn("analyze_trends est déprécié, utilisez analyze_trends_df",
+                      DeprecationWarning, stacklevel=2)
+        return self.analyze_trends_df(_jobs_to_dataframe(jobs))
+
+    def analyze_trends_df(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Analyse les tendances du marché de l'emploi à partir d'un DataFrame d'offres"""
         analysis = {
-            'total_jobs': len(jobs),
-            'top_technologies': self._get_top_items([tech for job in jobs for tech in job.technologies]),
-            'top_frameworks': self._get_top_items([fw for job in jobs for fw in job.frameworks]),
-            'top_certifications': self._get_top_items([cert for job in jobs for cert in job.certifications]),
-            'top_companies': self._get_top_items([job.company for job in jobs]),
-            'top_locations': self._get_top_items([job.location for job in jobs]),
-            'salary_analysis': self._analyze_salaries(jobs),
-            'recruiter_insights': self._analyze_recruiters(jobs)
+            'total_jobs': len(df),
+            'top_technologies': self._get_top_items(df['technologies'].explode()),
+            'top_frameworks': self._get_top_items(df['frameworks'].explode()),
+            'top_certifications': self._get_top_items(df['certifications'].explode()),
+            'top_companies': self._get_top_items(df['company']),
+            'top_locations': self._get_top_items(df['location']),
+            'salary_analysis': self._analyze_salaries(df),
+            'recruiter_insights': self._analyze_recruiters(df)
         }
 
         return analysis
 
-    def _get_top_items(self, items: List[str], top_n: int = 10) -> Dict[str, int]:
-        """Retourne les top N éléments les plus fréquents"""
-        from collections import Counter
-        counter = Counter(items)
-        return dict(counter.most_common(top_n))
+    def _get_top_items(self, items: pd.Series, top_n: int = 10) -> List[Tuple[str, int]]:
+        """Retourne les top N éléments les plus fréquents, sous forme de couples (élément, nombre) triés"""
+        # Conversion en int natif pour rester sérialisable en JSON
+        return [(item, int(count)) for item, count in items.value_counts().head(top_n).items()]
 
-    def _analyze_salaries(self, jobs: List[JobPosting]) -> Dict[str, Any]:
+    def _analyze_salaries(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyse les salaires"""
-        salaries = [job.salary_range for job in jobs if job.salary_range]
+        salaries = df.loc[df['salary_range'] != '', 'salary_range']
         return {
             'total_with_salary': len(salaries),
-            'percentage_with_salary': len(salaries) / len(jobs) * 100 if jobs else 0,
+            'percentage_with_salary': len(salaries) / len(df) * 100 if len(df) else 0,
             'salary_ranges': self._get_top_items(salaries)
         }
 
-    def _analyze_recruiters(self, jobs: List[JobPosting]) -> Dict[str, Any]:
+    def _analyze_recruiters(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyse les informations sur les recruteurs"""
-        recruiters = [job.recruiter for job in jobs if job.recruiter]
+        recruiters = df.loc[df['recruiter'] != '', 'recruiter']
         return {
             'total_with_recruiter_info': len(recruiters),
-            'percentage_with_recruiter_info': len(recruiters) / len(jobs) * 100 if jobs else 0,
+            'percentage_with_recruiter_info': len(recruiters) / len(df) * 100 if len(df) else 0,
             'top_recruiters': self._get_top_items(recruiters)
         }
 
 
+# Certifications classées par retour sur investissement (noms issus de CERT_KEYWORDS)
+HIGH_ROI_CERTS = frozenset(('AWS', 'Azure', 'GCP', 'CISSP', 'CISM', 'PMP'))
+MEDIUM_ROI_CERTS = frozenset(('Docker', 'Kubernetes', 'Scrum', 'DevOps'))
+
+
+# Ressources d'apprentissage recommandées par framework
+LEARNING_RECOMMENDATIONS = {
+    'React': 'Plateforme recommandée: React Official Docs + freeCodeCamp',
+    'Angular': 'Plateforme recommandée: Angular University + Pluralsight',
+    'Vue.js': 'Plateforme recommandée: Vue Mastery + Udemy',
+    'Django': 'Plateforme recommandée: Django Official Tutorial + Real Python',
+    'Flask': 'Plateforme recommandée: Flask Mega-Tutorial + YouTube',
+    'Spring': 'Plateforme recommandée: Spring.io Guides + Baeldung'
+}
+DEFAULT_LEARNING_RECOMMENDATION = 'Plateforme recommandée: Documentation officielle + Udemy/Coursera'
+
+
+@lru_cache(maxsize=None)
+def _get_learning_recommendation(framework: str) -> str:
+    """Retourne une recommandation d'apprentissage pour un framework"""
+    return LEARNING_RECOMMENDATIONS.get(framework, DEFAULT_LEARNING_RECOMMENDATION)
+
+
+@lru_cache(maxsize=None)
+def _estimate_certification_roi(certification: str) -> str:
+    """Estime le ROI d'une certification"""
+    if certification in HIGH_ROI_CERTS:
+        return 'High ROI (15-30% salary increase potential)'
+    elif certification in MEDIUM_ROI_CERTS:
+        return 'Medium ROI (10-20% salary increase potential)'
+    else:
+        return 'Variable ROI (5-15% salary increase potential)'
+
+
 class AIJobAgent:
     """Agent principal coordonnant toutes les activités"""
 
@@ -355,6 +723,9 @@ class AIJobAgent:
         self.indeed_scraper = None
         self.analyzer = JobMarketAnalyzer()
         self.openai_api_key = openai_api_key
+        self.driver_pool = None
+        self.session = None
+        self._seen_urls: Set[str] = set()
 
         # Configuration des mots-clés de recherche
         self.default_keywords = [
@@ -364,6 +735,23 @@ class AIJobAgent:
             "AI Engineer", "Cloud Engineer", "Cybersecurity Analyst", "Deep Learning"
         ]
 
+    async def __aenter__(self):
+        """Démarre la session HTTP et le pool de drivers Selenium partagés par tous les scrapers"""
+        self.session = _create_session()
+        # Les entrées expirées ne sont sinon supprimées que lors d'une relecture de la même clé
+        await self.session.delete_expired_responses()
+        self.driver_pool = ChromeDriverPool(max_workers=SELENIUM_WORKERS)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Ferme la session HTTP et le pool de drivers Selenium partagés"""
+        if self.driver_pool:
+            await asyncio.get_running_loop().run_in_executor(None, self.driver_pool.close)
+            self.driver_pool = None
+        if self.session:
+            await self.session.close()
+            self.session = None
+
     async def run_full_analysis(self,
                                 keywords: List[str] = None,
                                 locations: List[str] = ["Paris", "Lyon", "Marseille"],
@@ -374,29 +762,37 @@ class AIJobAgent:
 
         logger.info("Démarrage de l'analyse complète du marché de l'emploi...")
 
-        # Initialisation des scrapers
-        self.linkedin_scraper = LinkedInScraper(keywords)
-        self.indeed_scraper = IndeedScraper(keywords)
+        # Initialisation des scrapers (avec les ressources partagées si l'agent est utilisé via "async with")
+        self._seen_urls = set()
+        self.linkedin_scraper = LinkedInScraper(keywords, driver_pool=self.driver_pool, session=self.session,
+                                                seen_urls=self._seen_urls)
+        self.indeed_scraper = IndeedScraper(keywords, driver_pool=self.driver_pool, session=self.session,
+                                            seen_urls=self._seen_urls)
 
         all_jobs = []
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Scraping LinkedIn
-        logger.info("Scraping LinkedIn...")
-        for location in locations:
-            linkedin_jobs = await self.linkedin_scraper.scrape_jobs(location, limit_per_site)
-            all_jobs.extend(linkedin_jobs)
-            logger.info(f"LinkedIn {location}: {len(linkedin_jobs)} emplois collectés")
+        # Scraping concurrent de chaque couple (site, localisation)
+        logger.info("Scraping LinkedIn et Indeed...")
+        targets = [
+            self._scrape_target(site, scraper, location, limit_per_site)
+            for site, scraper in (("LinkedIn", self.linkedin_scraper), ("Indeed", self.indeed_scraper))
+            for location in locations
+        ]
 
-        # Scraping Indeed
-        logger.info("Scraping Indeed...")
-        for location in locations:
-            indeed_jobs = await self.indeed_scraper.scrape_jobs(location, limit_per_site)
-            all_jobs.extend(indeed_jobs)
-            logger.info(f"Indeed {location}: {len(indeed_jobs)} emplois collectés")
+        # Les offres sont écrites en Parquet au fur et à mesure que chaque scraping se termine
+        with pq.ParquetWriter(f'jobs_data_{timestamp}.parquet', JOBS_SCHEMA) as writer:
+            for next_result in asyncio.as_completed(targets):
+                site, location, site_jobs = await next_result
+                if site_jobs:
+                    writer.write_table(pa.Table.from_pylist([asdict(job) for job in site_jobs],
+                                                            schema=JOBS_SCHEMA))
+                all_jobs.extend(site_jobs)
+                logger.info(f"{site} {location}: {len(site_jobs)} emplois collectés")
 
         # Analyse des données
         logger.info("Analyse des données collectées...")
-        analysis = self.analyzer.analyze_trends(all_jobs)
+        analysis = self.analyzer.analyze_trends_df(_jobs_to_dataframe(all_jobs))
 
         # Génération de recommandations IA
         recommendations = await self._generate_ai_recommendations(analysis)
@@ -410,16 +806,20 @@ class AIJobAgent:
                 'analysis_date': datetime.now().isoformat()
             },
             'market_analysis': analysis,
-            'ai_recommendations': recommendations,
-            'raw_jobs_data': [vars(job) for job in all_jobs]  # Conversion en dict pour sérialisation
+            'ai_recommendations': recommendations
         }
 
         # Sauvegarde des résultats
-        self._save_results(final_report)
+        self._save_results(final_report, timestamp)
 
         logger.info("Analyse complète terminée!")
         return final_report
 
+    async def _scrape_target(self, site: str, scraper: JobScraper, location: str,
+                             limit: int) -> tuple:
+        """Scrape un couple (site, localisation) et retourne le résultat étiqueté"""
+        return site, location, await scraper.scrape_jobs(location, limit)
+
     async def _generate_ai_recommendations(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Génère des recommandations basées sur l'analyse IA"""
 
@@ -431,45 +831,44 @@ class AIJobAgent:
             'recruiter_networking_tips': []
         }
 
-        # Analyse des technologies les plus demandées
-        top_tech = analysis.get('top_technologies', {})
+        # Analyse des technologies les plus demandées (listes déjà triées par fréquence)
+        top_tech = analysis.get('top_technologies', [])
         if top_tech:
-            sorted_tech = sorted(top_tech.items(), key=lambda x: x[1], reverse=True)
             recommendations['top_skills_to_learn'] = [
                 {
                     'technology': tech,
                     'job_count': count,
                     'priority': 'High' if count > 10 else 'Medium' if count > 5 else 'Low'
                 }
-                for tech, count in sorted_tech[:10]
+                for tech, count in top_tech[:10]
             ]
 
         # Analyse des frameworks
-        top_frameworks = analysis.get('top_frameworks', {})
+        top_frameworks = analysis.get('top_frameworks', [])
         if top_frameworks:
             recommendations['emerging_technologies'] = [
                 {
                     'framework': fw,
                     'usage_frequency': count,
-                    'learning_recommendation': self._get_learning_recommendation(fw)
+                    'learning_recommendation': _get_learning_recommendation(fw)
                 }
-                for fw, count in sorted(top_frameworks.items(), key=lambda x: x[1], reverse=True)[:5]
+                for fw, count in top_frameworks[:5]
             ]
 
         # Analyse des certifications
-        top_certs = analysis.get('top_certifications', {})
+        top_certs = analysis.get('top_certifications', [])
         if top_certs:
             recommendations['certification_priorities'] = [
                 {
                     'certification': cert,
                     'demand_level': count,
-                    'estimated_roi': self._estimate_certification_roi(cert)
+                    'estimated_roi': _estimate_certification_roi(cert)
                 }
-                for cert, count in sorted(top_certs.items(), key=lambda x: x[1], reverse=True)[:5]
+                for cert, count in top_certs[:5]
             ]
 
         # Opportunités de marché
-        top_locations = analysis.get('top_locations', {})
+        top_locations = analysis.get('top_locations', [])
         if top_locations:
             recommendations['market_opportunities'] = [
                 {
@@ -477,7 +876,7 @@ class AIJobAgent:
                     'job_availability': count,
                     'market_attractiveness': 'High' if count > 20 else 'Medium' if count > 10 else 'Low'
                 }
-                for location, count in sorted(top_locations.items(), key=lambda x: x[1], reverse=True)[:5]
+                for location, count in top_locations[:5]
             ]
 
         # Conseils pour le networking avec les recruteurs
@@ -491,44 +890,13 @@ class AIJobAgent:
 
         return recommendations
 
-    def _get_learning_recommendation(self, framework: str) -> str:
-        """Retourne une recommandation d'apprentissage pour un framework"""
-        recommendations = {
-            'React': 'Plateforme recommandée: React Official Docs + freeCodeCamp',
-            'Angular': 'Plateforme recommandée: Angular University + Pluralsight',
-            'Vue.js': 'Plateforme recommandée: Vue Mastery + Udemy',
-            'Django': 'Plateforme recommandée: Django Official Tutorial + Real Python',
-            'Flask': 'Plateforme recommandée: Flask Mega-Tutorial + YouTube',
-            'Spring': 'Plateforme recommandée: Spring.io Guides + Baeldung'
-        }
-        return recommendations.get(framework, 'Plateforme recommandée: Documentation officielle + Udemy/Coursera')
-
-    def _estimate_certification_roi(self, certification: str) -> str:
-        """Estime le ROI d'une certification"""
-        high_roi_certs = ['AWS', 'Azure', 'GCP', 'CISSP', 'CISM', 'PMP']
-        medium_roi_certs = ['Docker', 'Kubernetes', 'Scrum', 'DevOps']
-
-        if any(cert in certification for cert in high_roi_certs):
-            return 'High ROI (15-30% salary increase potential)'
-        elif any(cert in certification for cert in medium_roi_certs):
-            return 'Medium ROI (10-20% salary increase potential)'
-        else:
-            return 'Variable ROI (5-15% salary increase potential)'
-
-    def _save_results(self, report: Dict[str, Any]):
+    def _save_results(self, report: Dict[str, Any], timestamp: str):
         """Sauvegarde les résultats de l'analyse"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Sauvegarde JSON
-        with open(f'job_market_analysis_{timestamp}.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        # Sauvegarde JSON (les offres brutes sont déjà écrites en Parquet pendant le scraping)
+        with open(f'job_market_analysis_{timestamp}.json', 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
 
-        # Sauvegarde CSV des emplois
-        if report.get('raw_jobs_data'):
-            df = pd.DataFrame(report['raw_jobs_data'])
-            df.to_csv(f'jobs_data_{timestamp}.csv', index=False, encoding='utf-8')
-
-        logger.info(f"Résultats sauvegardés: job_market_analysis_{timestamp}.json et jobs_data_{timestamp}.csv")
+        logger.info(f"Résultats sauvegardés: job_market_analysis_{timestamp}.json et jobs_data_{timestamp}.parquet")
 
 
 # Fonction principale d'utilisation
@@ -538,9 +906,6 @@ async def main():
     # Configuration
     OPENAI_API_KEY = "your-openai-api-key-here"  # Remplacer par votre clé API
 
-    # Initialisation de l'agent
-    agent = AIJobAgent(OPENAI_API_KEY)
-
     # Mots-clés personnalisés (optionnel)
     custom_keywords = [
         "Python Developer",
@@ -552,11 +917,13 @@ async def main():
 
     # Lancement de l'analyse complète
     try:
-        results = await agent.run_full_analysis(
-            keywords=custom_keywords,
-            locations=["Paris", "Lyon", "Toulouse", "Nantes"],
-            limit_per_site=30
-        )
+        # Initialisation de l'agent (session HTTP et drivers Selenium partagés pendant toute l'analyse)
+        async with AIJobAgent(OPENAI_API_KEY) as agent:
+            results = await agent.run_full_analysis(
+                keywords=custom_keywords,
+                locations=["Paris", "Lyon", "Toulouse", "Nantes"],
+                limit_per_site=30
+            )
 
         print("\n" + "=" * 50)
         print("ANALYSE COMPLETE DU MARCHE DE L'EMPLOI")
@@ -577,7 +944,7 @@ async def main():
             print(
                 f"• {opportunity['location']}: {opportunity['job_availability']} emplois ({opportunity['market_attractiveness']} attractivité)")
 
-        print("\nRésultats complets sauvegardés dans les fichiers JSON et CSV.")
+        print("\nRésultats complets sauvegardés dans les fichiers JSON et Parquet.")
 
     except Exception as e:
         logger.error(f"Erreur lors de l'exécution: {e}")
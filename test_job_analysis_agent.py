@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+
+import job_analysis_agent as jaa
+
+
+CARD = '<li class="job-search-card"><h3>Dev</h3><a href="https://fr.linkedin.com/jobs/view/{index}">x</a></li>'
+
+
+def _listing(count: int) -> str:
+    """Page de résultats LinkedIn contenant `count` cartes"""
+    return "<html><body><ul>" + "".join(CARD.format(index=i) for i in range(count)) + "</ul></body></html>"
+
+
+def test_parse_page_blank_body():
+    assert jaa._parse_page("") is None
+    assert jaa._parse_page("\n") is None
+    assert jaa._parse_page(_listing(1)) is not None
+
+
+def test_fetch_keyword_cards_stops_on_blank_last_page():
+    scraper = jaa.LinkedInScraper(["Python"])
+    pages = {0: _listing(10), 10: "\n"}
+
+    async def fake_fetch_html(session, url):
+        return pages.get(int(url.rsplit("&start=", 1)[1]), "")
+
+    scraper._fetch_html = fake_fetch_html
+
+    cards = asyncio.run(scraper._fetch_keyword_cards(None, "https://www.linkedin.com/jobs/search?keywords=Python",
+                                                     ".job-search-card", 30))
+
+    assert len(cards) == 10
+
+
+def test_is_new_url_indeed_identity_params():
+    scraper = jaa.IndeedScraper(["Python"])
+
+    assert scraper._is_new_url("https://www.indeed.com/rc/clk?jk=abc&fccid=1&vjs=3")
+    assert not scraper._is_new_url("https://www.indeed.com/rc/clk?jk=abc&fccid=2")
+    assert scraper._is_new_url("https://www.indeed.com/rc/clk?jk=def&fccid=1")
+
+    assert scraper._is_new_url("https://www.indeed.com/pagead/clk?mo=r&ad=111&p=0")
+    assert scraper._is_new_url("https://www.indeed.com/pagead/clk?mo=r&ad=222&p=1")
+    assert not scraper._is_new_url("https://www.indeed.com/pagead/clk?mo=r&ad=111&p=5")
+
+
+def test_normalize_url_without_identity_param_keeps_query():
+    url = "https://www.indeed.com/pagead/clk?mo=r&xkcb=42"
+    assert jaa._normalize_url(url, ('jk',)) == url
+
+
+def test_is_new_url_linkedin_strips_tracking():
+    scraper = jaa.LinkedInScraper(["Python"])
+
+    assert scraper._is_new_url("https://fr.linkedin.com/jobs/view/dev-123?position=1&trackingId=a")
+    assert not scraper._is_new_url("https://fr.linkedin.com/jobs/view/dev-123?position=4&trackingId=b")
+    assert scraper._is_new_url("https://fr.linkedin.com/jobs/view/dev-456?trackingId=a")
+
+
+def test_fetch_description_requests_normalized_url():
+    scraper = jaa.LinkedInScraper(["Python"])
+    requested = []
+
+    async def fake_fetch_html(session, url):
+        requested.append(url)
+        return '<html><body><div class="show-more-less-html__markup">Python</div></body></html>'
+
+    scraper._fetch_html = fake_fetch_html
+
+    for href in ("https://fr.linkedin.com/jobs/view/dev-123?refId=a&trackingId=b&position=1&pageNum=0",
+                 "https://fr.linkedin.com/jobs/view/dev-123?refId=c&trackingId=d&position=7&pageNum=2"):
+        description = asyncio.run(scraper._fetch_description(None, None, href, ".show-more-less-html__markup"))
+        assert description == "Python"
+
+    assert requested == ["https://fr.linkedin.com/jobs/view/dev-123"] * 2
+
+
+def test_driver_pool_stops_launching_chrome_after_failure(monkeypatch):
+    launches = []
+
+    def failing_chrome(**kwargs):
+        launches.append(kwargs)
+        time.sleep(0.05)
+        raise WebDriverException("chromedriver introuvable")
+
+    monkeypatch.setattr(jaa.webdriver, "Chrome", failing_chrome)
+    pool = jaa.ChromeDriverPool(max_workers=8)
+
+    async def run_all():
+        return await asyncio.gather(*[pool.run(lambda driver: driver) for _ in range(16)])
+
+    try:
+        assert asyncio.run(run_all()) == [None] * 16
+    finally:
+        pool.close()
+
+    assert len(launches) == 1
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_driver_pool_restarts_driver_after_dead_session(monkeypatch):
+    drivers = []
+
+    def fake_chrome(**kwargs):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(jaa.webdriver, "Chrome", fake_chrome)
+    pool = jaa.ChromeDriverPool(max_workers=1)
+
+    def dead_session(driver):
+        raise InvalidSessionIdException("invalid session id")
+
+    def missing_element(driver):
+        raise TimeoutException("élément absent")
+
+    async def scenario():
+        with pytest.raises(InvalidSessionIdException):
+            await pool.run(dead_session)
+        with pytest.raises(TimeoutException):
+            await pool.run(missing_element)
+        return await pool.run(lambda driver: driver)
+
+    try:
+        driver = asyncio.run(scenario())
+    finally:
+        pool.close()
+
+    # Session morte : driver fermé et remplacé ; simple timeout : driver conservé
+    assert len(drivers) == 2
+    assert drivers[0].quit_called
+    assert driver is drivers[1]